@@ -1,22 +1,62 @@
 """Database utilities and migration management."""
 import os
+import re
 from pathlib import Path
+
+import sqlparse
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import select, text
+from sqlalchemy import select, insert, update, delete, text, bindparam, event
+from sqlalchemy.pool import NullPool
 from models import Base, Todo
 
 MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
 # Database URL - defaults to SQLite for local development
-# Infrastructure layer should override this with environment variable
+# Infrastructure layer should override this with environment variable,
+# using the async driver (postgresql+asyncpg://...) for Postgres
 DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite+aiosqlite:///./todos.db")
 
+# Sync drivers like psycopg2 would block the event loop - fail fast
+if DATABASE_URL.startswith("postgresql") and "+asyncpg" not in DATABASE_URL:
+    raise RuntimeError(
+        "Postgres DATABASE_URL must use the asyncpg driver "
+        "(postgresql+asyncpg://...)"
+    )
+
 # Create async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    future=True
-)
+# SQLite doesn't benefit from connection pooling (single writer), so use
+# NullPool there. For Postgres, size the pool for concurrent FastAPI load
+# and guard against stale/hung connections.
+if DATABASE_URL.startswith("sqlite"):
+    engine = create_async_engine(
+        DATABASE_URL,
+        echo=False,
+        future=True,
+        poolclass=NullPool
+    )
+else:
+    engine = create_async_engine(
+        DATABASE_URL,
+        echo=False,
+        future=True,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_timeout=30,
+        connect_args={"server_settings": {"statement_timeout": "60000"}}
+    )
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Enable WAL so readers aren't blocked during writes."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -26,6 +66,33 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Statements already handled elsewhere: CREATE TABLE comes from the
+# SQLAlchemy models, and comment-led statements are documentation only
+_SKIP_STATEMENT_RE = re.compile(r"^\s*(--|CREATE\s+TABLE)", re.IGNORECASE)
+
+# Parsed migration statements keyed by (path, mtime) so repeated
+# init_db calls (e.g. in tests) don't re-read or re-parse files
+_migration_cache = {}
+
+
+def _load_migration_statements(migration_file: Path):
+    """Parse a migration file into the statements to execute (cached)."""
+    cache_key = (migration_file, migration_file.stat().st_mtime)
+    cached = _migration_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    statements = tuple(
+        statement
+        for statement in (
+            s.strip() for s in sqlparse.split(migration_file.read_text())
+        )
+        if statement and not _SKIP_STATEMENT_RE.match(statement)
+    )
+    _migration_cache[cache_key] = statements
+    return statements
+
+
 async def get_db():
     """Get database session."""
     async with AsyncSessionLocal() as session:
@@ -41,104 +108,125 @@ async def init_db():
         
         # Run SQL migrations for additional setup (indexes, etc.)
         migration_files = sorted(MIGRATIONS_DIR.glob("*.sql"))
-        
+
+        # One bulk query for the applied versions instead of one per file
+        result = await conn.execute(text("SELECT version FROM schema_migrations"))
+        applied = {row.version for row in result}
+
         for migration_file in migration_files:
             version = migration_file.stem
-            
-            # Check if migration already applied
-            result = await conn.execute(
-                text("SELECT version FROM schema_migrations WHERE version = :version"),
-                {"version": version}
-            )
-            row = result.fetchone()
-            
-            if row is None:
-                print(f"Applying migration: {version}")
-                
-                # Read and execute migration
-                with open(migration_file, 'r') as f:
-                    migration_sql = f.read()
-                
-                # Execute each statement separately
-                for statement in migration_sql.split(';'):
-                    statement = statement.strip()
-                    if statement and not statement.startswith('--'):
-                        # Skip CREATE TABLE statements - already handled by models
-                        if not statement.upper().startswith('CREATE TABLE'):
-                            await conn.execute(text(statement))
-                
-                # Record migration as applied
+
+            if version in applied:
+                print(f"Migration {version} already applied, skipping")
+                continue
+
+            print(f"Applying migration: {version}")
+
+            statements = _load_migration_statements(migration_file)
+
+            # Send the whole script in one driver round trip, with the
+            # version record in the same savepoint so a partial
+            # application rolls back together
+            async with conn.begin_nested():
+                if statements:
+                    await conn.exec_driver_sql(";\n".join(statements))
+
                 await conn.execute(
                     text("INSERT INTO schema_migrations (version) VALUES (:version)"),
                     {"version": version}
                 )
-                
-                print(f"✓ Migration {version} applied successfully")
-            else:
-                print(f"Migration {version} already applied, skipping")
+
+            print(f"✓ Migration {version} applied successfully")
         
         print("Database initialized successfully!")
 
 
+# Hot-path statements built once at import time so SQLAlchemy reuses the
+# same compiled-statement cache entry instead of rebuilding the expression
+# tree on every request
+_STMT_ALL_TODOS = select(Todo).order_by(Todo.created_at.desc())
+_STMT_ALL_TODOS_CORE = select(
+    Todo.id,
+    Todo.title,
+    Todo.description,
+    Todo.completed,
+    Todo.created_at,
+    Todo.priority
+).order_by(Todo.created_at.desc())
+_STMT_TODO_BY_ID = select(Todo).where(Todo.id == bindparam("id"))
+
+
 async def get_all_todos(session: AsyncSession):
     """Get all todos from database."""
-    result = await session.execute(
-        select(Todo).order_by(Todo.created_at.desc())
-    )
+    result = await session.execute(_STMT_ALL_TODOS)
     return result.scalars().all()
 
 
+async def get_all_todos_core(session: AsyncSession):
+    """Get all todos as plain column mappings, skipping ORM hydration."""
+    result = await session.execute(_STMT_ALL_TODOS_CORE)
+    return result.mappings().all()
+
+
 async def get_todo_by_id(session: AsyncSession, todo_id: int):
     """Get a single todo by ID."""
-    result = await session.execute(
-        select(Todo).where(Todo.id == todo_id)
-    )
+    result = await session.execute(_STMT_TODO_BY_ID, {"id": todo_id})
     return result.scalar_one_or_none()
 
 
 async def create_todo(session: AsyncSession, title: str, description: str = None, priority: int = 0):
     """Create a new todo."""
-    todo = Todo(
-        title=title,
-        description=description,
-        completed=False,
-        priority=priority
+    # INSERT ... RETURNING hands back the row (including the server-side
+    # created_at default) in one round trip, so no refresh is needed
+    result = await session.execute(
+        insert(Todo)
+        .values(
+            title=title,
+            description=description,
+            completed=False,
+            priority=priority
+        )
+        .returning(Todo)
     )
-    session.add(todo)
+    todo = result.scalar_one()
     await session.commit()
-    await session.refresh(todo)
     return todo
 
 
 async def update_todo(session: AsyncSession, todo_id: int, title: str = None, description: str = None, completed: bool = None, priority: int = None):
     """Update an existing todo."""
-    todo = await get_todo_by_id(session, todo_id)
-    
-    if todo is None:
-        return None
-    
-    # Update fields if provided
+    # Only set fields that were provided
+    fields = {}
     if title is not None:
-        todo.title = title
+        fields["title"] = title
     if description is not None:
-        todo.description = description
+        fields["description"] = description
     if completed is not None:
-        todo.completed = completed
+        fields["completed"] = completed
     if priority is not None:
-        todo.priority = priority
-    
+        fields["priority"] = priority
+
+    # Nothing to update - just return the current row
+    if not fields:
+        return await get_todo_by_id(session, todo_id)
+
+    # Single UPDATE ... RETURNING instead of SELECT-then-UPDATE
+    result = await session.execute(
+        update(Todo)
+        .where(Todo.id == todo_id)
+        .values(**fields)
+        .returning(Todo)
+    )
+    todo = result.scalar_one_or_none()
     await session.commit()
-    await session.refresh(todo)
     return todo
 
 
 async def delete_todo(session: AsyncSession, todo_id: int):
     """Delete a todo."""
-    todo = await get_todo_by_id(session, todo_id)
-    
-    if todo is None:
-        return False
-    
-    await session.delete(todo)
+    # Single DELETE instead of SELECT-then-DELETE
+    result = await session.execute(
+        delete(Todo).where(Todo.id == todo_id)
+    )
     await session.commit()
-    return True
+    return result.rowcount > 0
@@ -1,12 +1,15 @@
+import os
+
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import init_db, get_db, get_all_todos, create_todo as db_create_todo, update_todo as db_update_todo, delete_todo as db_delete_todo
+from db import init_db, get_db, get_all_todos_core, get_todo_by_id, create_todo as db_create_todo, update_todo as db_update_todo, delete_todo as db_delete_todo
 
 
 @asynccontextmanager
@@ -20,15 +23,30 @@ async def lifespan(app: FastAPI):
     print("Shutting down...")
 
 
-app = FastAPI(title="Todo App API", lifespan=lifespan)
+app = FastAPI(
+    title="Todo App API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Configure CORS - an explicit origin list lets the middleware
+# short-circuit matched origins instead of echoing every request's
+# origin, and the restricted methods/headers make preflights cacheable
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get(
+        "CORS_ORIGINS", "http://localhost:5173,http://localhost:3000"
+    ).split(",")
+    if origin.strip()
+]
 
-# Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins in development
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 
@@ -72,8 +90,10 @@ async def health_check():
 @app.get("/api/todos", response_model=list[TodoResponse])
 async def get_todos(session: AsyncSession = Depends(get_db)):
     """Get all todos from the database."""
-    todos = await get_all_todos(session)
-    return todos
+    # Core rows skip ORM hydration; model_construct skips re-validating
+    # values that came straight from the database
+    rows = await get_all_todos_core(session)
+    return [TodoResponse.model_construct(**row) for row in rows]
 
 
 @app.post("/api/todos", response_model=TodoResponse, status_code=201)
@@ -91,14 +111,18 @@ async def create_todo(todo: TodoCreate, session: AsyncSession = Depends(get_db))
 @app.put("/api/todos/{todo_id}", response_model=TodoResponse)
 async def update_todo(todo_id: int, todo_update: TodoUpdate, session: AsyncSession = Depends(get_db)):
     """Update an existing todo in the database."""
-    updated_todo = await db_update_todo(
-        session,
-        todo_id=todo_id,
-        title=todo_update.title,
-        description=todo_update.description,
-        completed=todo_update.completed,
-        priority=todo_update.priority
-    )
+    # Empty body: nothing to write, just return the current row
+    if not todo_update.model_dump(exclude_unset=True):
+        updated_todo = await get_todo_by_id(session, todo_id)
+    else:
+        updated_todo = await db_update_todo(
+            session,
+            todo_id=todo_id,
+            title=todo_update.title,
+            description=todo_update.description,
+            completed=todo_update.completed,
+            priority=todo_update.priority
+        )
     
     if updated_todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
@@ -113,3 +137,9 @@ async def delete_todo(todo_id: int, session: AsyncSession = Depends(get_db)):
     if not success:
         raise HTTPException(status_code=404, detail="Todo not found")
 
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", host="0.0.0.0", port=8000)
+
@@ -1,29 +1,42 @@
 """SQLAlchemy database models."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
-from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+from typing import Optional
 
-Base = declarative_base()
+from sqlalchemy import DateTime, Index, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    """Declarative base for all models."""
 
 
 class Todo(Base):
     """Todo model."""
     __tablename__ = "todos"
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False)
-    description = Column(String, nullable=True)
-    completed = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    priority = Column(Integer, default=0, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    description: Mapped[Optional[str]]
+    completed: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    priority: Mapped[int] = mapped_column(default=0)
 
     def __repr__(self):
         return f"<Todo(id={self.id}, title='{self.title}', completed={self.completed})>"
 
 
+# Matches idx_todos_created_at from migration 002 so fresh databases
+# created via create_all() get the same ORDER BY created_at DESC index
+Index("idx_todos_created_at", Todo.created_at.desc())
+
+
 class SchemaMigration(Base):
     """Schema migrations tracking."""
     __tablename__ = "schema_migrations"
 
-    version = Column(String, primary_key=True)
-    applied_at = Column(DateTime(timezone=True), server_default=func.now())
-
+    version: Mapped[str] = mapped_column(primary_key=True)
+    applied_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )